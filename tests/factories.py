@@ -17,10 +17,20 @@
 """
 Test Factory to make fake objects for testing
 """
+from decimal import Decimal
 import factory
-from factory.fuzzy import FuzzyChoice, FuzzyDecimal
+from factory.fuzzy import FuzzyChoice
+from faker import Faker
 from service.models import Product, Category
 
+# Generating text with Faker is slow so build a pool of descriptions once,
+# from a seeded instance so the pool is the same on every run
+_faker = Faker()
+_faker.seed_instance(0)
+_DESC_POOL = tuple(_faker.text(max_nb_chars=250) for _ in range(32))
+# Every real category, so new ones are picked up without editing the factory
+_CATEGORIES = tuple(category for category in Category if category is not Category.UNKNOWN)
+
 
 class ProductFactory(factory.Factory):
     """Creates fake products for testing"""
@@ -31,13 +41,9 @@ class ProductFactory(factory.Factory):
 
     id = factory.Sequence(lambda n: n)
     name = FuzzyChoice(["Hat", "Pants", "Shirt", "Apple", "Banana", "Pots", "Towels", "Ford", "Chevy", "Hammer", "Wrench"])
-    description = factory.Faker('text', max_nb_chars=250)
-    price = FuzzyDecimal(0.5, 1000.0, precision=2)
+    description = FuzzyChoice(_DESC_POOL)
+    price = factory.LazyFunction(
+        lambda: Decimal(f"{factory.random.randgen.uniform(0.5, 1000.0):.2f}")
+    )
     available = FuzzyChoice([True, False])
-    category = FuzzyChoice([
-        Category.CLOTHS,
-        Category.FOOD,
-        Category.HOUSEWARES,
-        Category.AUTOMOTIVE,
-        Category.TOOLS
-    ])
+    category = FuzzyChoice(_CATEGORIES)
@@ -73,7 +73,8 @@ class TestProductRoutes(TestCase):
         db.session.commit()
 
     def tearDown(self):
-        db.session.remove()
+        """Runs after each test"""
+        db.session.rollback()
 
     ############################################################
     # Utility function to bulk create products
@@ -82,7 +83,7 @@ class TestProductRoutes(TestCase):
         """Factory method to create products in bulk"""
         products = []
         for _ in range(count):
-            test_product = ProductFactory()
+            test_product = ProductFactory.build()
             response = self.client.post(BASE_URL, json=test_product.serialize())
             self.assertEqual(
                 response.status_code, status.HTTP_201_CREATED, "Could not create test product"
@@ -113,7 +114,7 @@ class TestProductRoutes(TestCase):
     # ----------------------------------------------------------
     def test_create_product(self):
         """It should Create a new Product"""
-        test_product = ProductFactory()
+        test_product = ProductFactory.build()
         logging.debug("Test Product: %s", test_product.serialize())
         response = self.client.post(BASE_URL, json=test_product.serialize())
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -193,7 +194,7 @@ class TestProductRoutes(TestCase):
     def test_update_product(self):
         """It should Update an existing Product"""
         # create a product to update
-        test_product = ProductFactory()
+        test_product = ProductFactory.build()
         response = self.client.post(BASE_URL, json=test_product.serialize())
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         # update the product
@@ -206,7 +207,7 @@ class TestProductRoutes(TestCase):
 
     def test_update_product_not_found(self):
         """It should return 404 when updating non-existent Product"""
-        product = ProductFactory()
+        product = ProductFactory.build()
         update_data = product.serialize()
         update_data["name"] = "Ghost Product"
         response = self.client.put(f"{BASE_URL}/0", json=update_data)